@@ -1,4 +1,5 @@
 import os
+import threading
 
 import wx
 
@@ -10,12 +11,8 @@ from scriptHandler import script
 from synthDriverHandler import getSynth
 import ui
 
-from .speechSettingsDialog import WorldVoiceSettingsDialog
-from generics.speechSymbols.views import SpeechSymbolsDialog
-
 from synthDrivers.WorldVoice import WVStart, WVEnd
 from synthDrivers.WorldVoice.hook import Hook
-from synthDrivers.WorldVoice.sayAll import patch, unpatch
 from synthDrivers.WorldVoice.voiceManager import AisoundVoice
 
 addonHandler.initTranslation()
@@ -23,9 +20,55 @@ ADDON_SUMMARY = addonHandler.getCodeAddon().manifest["summary"]
 workspace_path = os.path.join(globalVars.appArgs.configPath, "WorldVoice-workspace")
 
 
+def _extractZip(path, import_path, maxWorkers=4):
+	from concurrent.futures import ThreadPoolExecutor
+	from zipfile import ZipFile, ZipInfo
+
+	with ZipFile(path, 'r') as core_file:
+		# Like extractall(), the last member wins when names are duplicated.
+		members = list({info.filename: info for info in core_file.infolist()}.values())
+
+		# ZipFile.extract creates missing directories without exist_ok, so make them all
+		# here, serially, before any worker runs. Going through extract keeps the stdlib
+		# member name sanitisation; directory entries are created without reading data.
+		os.makedirs(import_path, exist_ok=True)
+		parents = set()
+		files = []
+		for info in members:
+			if info.is_dir():
+				core_file.extract(info, import_path)
+				continue
+			parent = info.filename.rpartition('/')[0]
+			if parent and parent not in parents:
+				parents.add(parent)
+				core_file.extract(ZipInfo(parent + '/'), import_path)
+			files.append(info)
+
+	# ZipFile is not safe to read from several threads, so each worker opens its own.
+	local = threading.local()
+	openedFiles = []
+
+	def extractMember(info):
+		core_file = getattr(local, "core_file", None)
+		if core_file is None:
+			core_file = local.core_file = ZipFile(path, 'r')
+			openedFiles.append(core_file)
+		core_file.extract(info, import_path)
+
+	try:
+		with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+			futures = [executor.submit(extractMember, info) for info in files]
+		for future in futures:
+			future.result()
+	finally:
+		for core_file in openedFiles:
+			core_file.close()
+
+
 class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 	def __init__(self):
 		super().__init__()
+		self._started = False
 
 		if globalVars.appArgs.secure:
 			return
@@ -36,8 +79,8 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 
 		WVStart.register(self.hookInstance.start)
 		WVEnd.register(self.hookInstance.end)
-		WVStart.register(patch)
-		WVEnd.register(unpatch)
+		WVStart.register(self.onWVStart)
+		WVEnd.register(self.onWVEnd)
 		if getSynth().name == "WorldVoice":
 			WVStart.notify()
 
@@ -47,25 +90,39 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		except wx.PyDeadObjectError:
 			pass
 
-		if getSynth().name == "WorldVoice":
+		if self._started:
 			WVEnd.notify()
 		WVStart.unregister(self.hookInstance.start)
 		WVEnd.unregister(self.hookInstance.end)
-		WVStart.unregister(patch)
-		WVEnd.unregister(unpatch)
+		WVStart.unregister(self.onWVStart)
+		WVEnd.unregister(self.onWVEnd)
+
+	def onWVStart(self):
+		# Only pull in the say all patch once WorldVoice is actually in use.
+		from synthDrivers.WorldVoice.sayAll import patch
+		patch()
+		self._started = True
+
+	def onWVEnd(self):
+		if self._started:
+			from synthDrivers.WorldVoice.sayAll import unpatch
+			unpatch()
+		self._started = False
 
 	def createMenu(self):
 		self.submenu_vocalizer = wx.Menu()
+		self._menuDispatch = {}
 
 		item = self.submenu_vocalizer.Append(wx.ID_ANY, _("&Speech Settings"), _("Speech Settings."))
-		gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, self.popup_SpeechSettingsDialog, item)
+		self._menuDispatch[item.GetId()] = self.popup_SpeechSettingsDialog
 		item = self.submenu_vocalizer.Append(wx.ID_ANY, _("&Unicode Settings"), _("Unicode Settings."))
-		gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, self.popup_SpeechSymbolsDialog, item)
+		self._menuDispatch[item.GetId()] = self.popup_SpeechSymbolsDialog
 		item = self.submenu_vocalizer.Append(wx.ID_ANY, _("&File Import"), _("Import File."))
-		gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, self.onFileImport, item)
+		self._menuDispatch[item.GetId()] = self.onFileImport
 		if not AisoundVoice.install():
 			item = self.submenu_vocalizer.Append(wx.ID_ANY, _("&Aisound Core Install"), _("Install Aisound Core."))
-			gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, self.onAisoundCoreInstall, item)
+			self._menuDispatch[item.GetId()] = self.onAisoundCoreInstall
+		self.submenu_vocalizer.Bind(wx.EVT_MENU, self.onMenu)
 
 		self.submenu_item = gui.mainFrame.sysTrayIcon.menu.Insert(2, wx.ID_ANY, _("WorldVoice"), self.submenu_vocalizer)
 
@@ -77,30 +134,57 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 				pass
 			self.submenu_item.Destroy()
 
+	def onMenu(self, event):
+		try:
+			handler = self._menuDispatch[event.GetId()]
+		except KeyError:
+			event.Skip()
+			return
+		handler(event)
+
 	def fileImport(self, import_path):
 		with wx.FileDialog(gui.mainFrame, message=_("Import file..."), wildcard="zip files (*.zip)|*.zip") as entryDialog:
 			if entryDialog.ShowModal() != wx.ID_OK:
 				return
 
 			path = entryDialog.GetPath()
-			try:
-				from zipfile import ZipFile
-				with ZipFile(path, 'r') as core_file:
-					core_file.testzip()
-					core_file.extractall(import_path)
-			except BaseException:
+
+		progressDialog = wx.ProgressDialog(
+			_("Import File"),
+			_("Importing..."),
+			parent=gui.mainFrame,
+			style=wx.PD_APP_MODAL,
+		)
+		pulseTimer = wx.Timer(progressDialog)
+		progressDialog.Bind(wx.EVT_TIMER, lambda event: progressDialog.Pulse(), pulseTimer)
+		pulseTimer.Start(100)
+
+		def onDone(exc):
+			pulseTimer.Stop()
+			progressDialog.Destroy()
+			if exc is not None:
 				gui.messageBox(
 					_("Import fail"),
 					_("Import File"), wx.OK
 				)
+				return
+			if gui.messageBox(
+				_("For the new file to import, NVDA must be restarted. Are you want to restart NVDA now ?"),
+				_("Import File"), wx.OK | wx.CANCEL | wx.ICON_WARNING
+			) == wx.OK:
+				import core
+				import queueHandler
+				queueHandler.queueFunction(queueHandler.eventQueue, core.restart)
+
+		def extract():
+			try:
+				_extractZip(path, import_path)
+			except BaseException as e:
+				wx.CallAfter(onDone, e)
 			else:
-				if gui.messageBox(
-					_("For the new file to import, NVDA must be restarted. Are you want to restart NVDA now ?"),
-					_("Import File"), wx.OK | wx.CANCEL | wx.ICON_WARNING
-				) == wx.OK:
-					import core
-					import queueHandler
-					queueHandler.queueFunction(queueHandler.eventQueue, core.restart)
+				wx.CallAfter(onDone, None)
+
+		threading.Thread(target=extract, name="WorldVoiceFileImport", daemon=True).start()
 
 	def onFileImport(self, event):
 		self.fileImport(workspace_path)
@@ -109,9 +193,11 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		self.fileImport(AisoundVoice.workspace)
 
 	def popup_SpeechSettingsDialog(self, event):
+		from .speechSettingsDialog import WorldVoiceSettingsDialog
 		wx.CallAfter(gui.mainFrame.popupSettingsDialog, WorldVoiceSettingsDialog)
 
 	def popup_SpeechSymbolsDialog(self, event):
+		from generics.speechSymbols.views import SpeechSymbolsDialog
 		if SpeechSymbolsDialog._instance is None:
 			gui.mainFrame.popupSettingsDialog(SpeechSymbolsDialog)
 		else:
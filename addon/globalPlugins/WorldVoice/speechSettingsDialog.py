@@ -65,6 +65,11 @@ class SpeechRoleSettingsPanel(SettingsPanel):
 	title = _("Speech Role")
 
 	def makeSettings(self, sizer):
+		# onSave and onDiscard use these even when the panel is built in one of its early-return branches.
+		self._pendingParams = {}
+		self._paramApplyTimer = wx.Timer(self)
+		self.Bind(wx.EVT_TIMER, self.onParamApplyTimer, self._paramApplyTimer)
+
 		if not getSynth().name == 'WorldVoice':
 			infoLabel = wx.StaticText(self, label=_('Your current speech synthesizer is not WorldVoice.'))
 			infoLabel.Wrap(self.GetSize()[0])
@@ -85,10 +90,13 @@ class SpeechRoleSettingsPanel(SettingsPanel):
 			self._manager.activeEngines = [key for key, value in config.conf["WorldVoice"]["engine"].items() if value]
 
 		self._localeToVoices = self._manager.localeToVoicesMapEngineFilter
+		self._localeToVoiceChoices = {locale: ["no-select"] + voices for locale, voices in self._localeToVoices.items()}
 		self.localesToNames = self._manager.localesToNamesMapEngineFilter
 		self._locales = self._manager.languagesEngineFilter
 
 		self._dataToPercist = defaultdict(lambda: {})
+		self._activeVoiceName = None
+		self._activeVoiceInstance = None
 		latinSet = set(languageDetection.ALL_LATIN) & set(l for l in self._locales if len(l) == 2)
 		self._latinLocales = sorted(list(latinSet))
 		CJKSet = set(languageDetection.CJK) & set(l for l in self._locales if len(l) == 2)
@@ -161,16 +169,20 @@ class SpeechRoleSettingsPanel(SettingsPanel):
 		voiceName = self._voicesChoice.GetStringSelection()
 		if voiceName == '' or voiceName == 'no-select':
 			return
-		voiceInstance = self._manager.getVoiceInstance(voiceName)
-		return voiceInstance
+		if voiceName != self._activeVoiceName:
+			self._activeVoiceInstance = self._manager.getVoiceInstance(voiceName)
+			self._activeVoiceName = voiceName
+		return self._activeVoiceInstance
 
 	def _updateVoicesSelection(self):
 		localeIndex = self._localesChoice.GetCurrentSelection()
 		if localeIndex < 0:
 			self._voicesChoice.SetItems([])
+			self._variantsChoice.SetItems([])
+			self.sliderDisable()
 		else:
 			locale = self._locales[localeIndex]
-			voices = ["no-select"] + self._localeToVoices[locale]
+			voices = self._localeToVoiceChoices[locale]
 			self._voicesChoice.SetItems(voices)
 			if locale in config.conf["WorldVoice"]["speechRole"]:
 				try:
@@ -208,12 +220,15 @@ class SpeechRoleSettingsPanel(SettingsPanel):
 		self._updateVoicesSelection()
 
 	def onVoiceChange(self, event):
+		self.flushPendingParams()
 		localeIndex = self._localesChoice.GetCurrentSelection()
 		locale = self._locales[localeIndex]
 		voiceName = self._voicesChoice.GetStringSelection()
 		if voiceName != "no-select":
 			self._dataToPercist[locale]["voice"] = self._voicesChoice.GetStringSelection()
 			voiceInstance = self._manager.getVoiceInstance(voiceName)
+			self._activeVoiceInstance = voiceInstance
+			self._activeVoiceName = voiceName
 			if self._keepParameterConsistentCheckBox.GetValue():
 				mainVoiceInstance = self._manager._defaultVoiceInstance
 				voiceInstance.rate = mainVoiceInstance.rate
@@ -247,12 +262,14 @@ class SpeechRoleSettingsPanel(SettingsPanel):
 		self._manager.onKeepEngineConsistent()
 
 		self._localeToVoices = self._manager.localeToVoicesMapEngineFilter
+		self._localeToVoiceChoices = {locale: ["no-select"] + voices for locale, voices in self._localeToVoices.items()}
 		self.localesToNames = self._manager.localesToNamesMapEngineFilter
 		self._locales = self._manager.languagesEngineFilter
 		self._localesChoice.SetItems([self.localesToNames[l] for l in self._locales])
 		self._updateVoicesSelection()
 
 	def onKeepParameterConsistentChange(self, event):
+		self.flushPendingParams()
 		voiceName = self._voicesChoice.GetStringSelection()
 		if voiceName == "":
 			if self._keepParameterConsistentCheckBox.GetValue():
@@ -296,44 +313,60 @@ class SpeechRoleSettingsPanel(SettingsPanel):
 		self._rateBoostCheckBox.Disable()
 
 	def onSpeechRateSliderScroll(self, event):
-		if self.voiceInstance:
-			self.voiceInstance.rate = self._rateSlider.GetValue()
-			if self._keepParameterConsistentCheckBox.GetValue():
-				self._manager.onVoiceParameterConsistent(self.voiceInstance)
+		self._queueParam("rate", self._rateSlider.GetValue())
 
 	def onPitchSliderScroll(self, event):
-		if self.voiceInstance:
-			self.voiceInstance.pitch = self._pitchSlider.GetValue()
-			if self._keepParameterConsistentCheckBox.GetValue():
-				self._manager.onVoiceParameterConsistent(self.voiceInstance)
+		self._queueParam("pitch", self._pitchSlider.GetValue())
 
 	def onVolumeSliderScroll(self, event):
-		if self.voiceInstance:
-			self.voiceInstance.volume = self._volumeSlider.GetValue()
-			if self._keepParameterConsistentCheckBox.GetValue():
-				self._manager.onVoiceParameterConsistent(self.voiceInstance)
+		self._queueParam("volume", self._volumeSlider.GetValue())
 
 	def onInflectionSliderScroll(self, event):
-		if self.voiceInstance:
-			self.voiceInstance.inflection = self._inflectionSlider.GetValue()
+		self._queueParam("inflection", self._inflectionSlider.GetValue())
+
+	def _queueParam(self, attr, value):
+		# Nothing to apply while no voice is selected, e.g. after the voice list was reset.
+		if self.voiceInstance is None:
+			return
+		self._pendingParams[attr] = value
+		self._paramApplyTimer.StartOnce(50)
+
+	def onParamApplyTimer(self, event):
+		self.flushPendingParams()
+
+	def flushPendingParams(self):
+		self._paramApplyTimer.Stop()
+		if not self._pendingParams:
+			return
+		pendingParams = self._pendingParams
+		self._pendingParams = {}
+		# Apply to the voice the sliders were moved for, which may no longer be selected.
+		voiceInstance = self._activeVoiceInstance
+		if voiceInstance:
+			for attr, value in pendingParams.items():
+				setattr(voiceInstance, attr, value)
 			if self._keepParameterConsistentCheckBox.GetValue():
-				self._manager.onVoiceParameterConsistent(self.voiceInstance)
+				self._manager.onVoiceParameterConsistent(voiceInstance)
 
 	def onRateBoostChange(self, event):
-		if self.voiceInstance:
-			self.voiceInstance.rateBoost = self._rateBoostCheckBox.GetValue()
+		voiceInstance = self.voiceInstance
+		if voiceInstance:
+			voiceInstance.rateBoost = self._rateBoostCheckBox.GetValue()
 			if self._keepParameterConsistentCheckBox.GetValue():
-				self._manager.onVoiceParameterConsistent(self.voiceInstance)
+				self._manager.onVoiceParameterConsistent(voiceInstance)
 
 	def onDiscard(self):
 		if not getSynth().name == 'WorldVoice':
 			return
+		self._paramApplyTimer.Stop()
+		self._pendingParams = {}
 		for instance in self._manager._instanceCache.values():
 			instance.rollback()
 
 	def onSave(self):
 		if not getSynth().name == 'WorldVoice':
 			return
+		self.flushPendingParams()
 		temp = defaultdict(lambda: {})
 		for key, value in config.conf["WorldVoice"]["speechRole"].items():
 			if isinstance(value, config.AggregatedSection):
@@ -5,6 +5,7 @@
 # Julien Cochuyt
 
 
+from functools import partial
 from typing import Callable, Optional
 import weakref
 from logHandler import log
@@ -27,6 +28,7 @@ from speech.types import (
 
 
 SayAllHandler = None
+_SAY_ALL_LINE_REACHED_NAME = "say-all:lineReached"
 
 
 def initialize(
@@ -46,9 +48,14 @@ def initialize(
 
 
 class _SayAllHandler(sayAll._SayAllHandler):
+	def _setActiveSayAll(self, reader):
+		# Keep this weak: isRunning() relies on the reader dying once say all is complete.
+		# weakref.ref without a callback reuses an existing reference to the same reader.
+		self._getActiveSayAll = weakref.ref(reader)
+
 	def readObjects(self, obj: 'NVDAObjects.NVDAObject'):
 		reader = _ObjectsReader(self, obj)
-		self._getActiveSayAll = weakref.ref(reader)
+		self._setActiveSayAll(reader)
 		reader.next()
 
 	def readText(
@@ -71,7 +78,7 @@ class _SayAllHandler(sayAll._SayAllHandler):
 		except NotImplementedError:
 			log.debugWarning("Unable to make reader", exc_info=True)
 			return
-		self._getActiveSayAll = weakref.ref(reader)
+		self._setActiveSayAll(reader)
 		reader.nextLine()
 
 
@@ -99,18 +106,16 @@ class _TextReader(sayAll._TextReader):
 				return
 		self.initialIteration = False
 		bookmark = self.reader.bookmark
-		# Copy the speakTextInfoState so that speak callbackCommand
-		# and its associated callback are using a copy isolated to this specific line.
-		state = self.speakTextInfoState.copy()
+		# The reader's speakTextInfoState is a copy owned by this reader alone
+		# (see the end of this method), so this line's callbackCommand can take it over
+		# and the reader keeps a fresh copy for the next line.
+		state = self.speakTextInfoState
 		# Call lineReached when we start speaking this line.
 		# lineReached will move the cursor and trigger reading of the next line.
 
-		def _onLineReached(obj=self.reader.obj, state=state):
-			self.lineReached(obj, bookmark, state)
-
 		cb = CallbackCommand(
-			_onLineReached,
-			name="say-all:lineReached"
+			partial(self.lineReached, self.reader.obj, bookmark, state),
+			name=_SAY_ALL_LINE_REACHED_NAME
 		)
 
 		# Generate the speech sequence for the reader textInfo
@@ -123,8 +128,8 @@ class _TextReader(sayAll._TextReader):
 			reason=controlTypes.OutputReason.SAYALL,
 			useCache=state
 		)
-		seq = list(_flattenNestedSequences(speechGen))
-		seq.insert(0, cb)
+		seq = [cb]
+		seq.extend(_flattenNestedSequences(speechGen))
 		if config.conf["speech"]["WorldVoice"]["sayallwaitfactor"] > 0:
 			seq.append(BreakCommand(config.conf["speech"]["WorldVoice"]["sayallwaitfactor"] * 5))
 		# Speak the speech sequence.
@@ -1,3 +1,4 @@
+from autoSettingsUtils.utils import paramToPercent, percentToParam
 import config
 import globalVars
 import languageHandler
@@ -47,7 +48,7 @@ class VEVoice(Voice):
 		value = percent
 		factor = 25.0 if value >= 50 else 50.0
 		norm = 2.0 ** ((value - 50.0) / factor)
-		self._rate = value = int(round(norm * 100))
+		self._rate = int(round(norm * 100))
 		_vocalizer.setParameter(self.tts, _vocalizer.VE_PARAM_SPEECHRATE, self._rate)
 
 	@property
@@ -61,18 +62,18 @@ class VEVoice(Voice):
 		value = percent
 		factor = 50.0
 		norm = 2.0 ** ((value - 50.0) / factor)
-		self._pitch = value = int(round(norm * 100))
+		self._pitch = int(round(norm * 100))
 		_vocalizer.setParameter(self.tts, _vocalizer.VE_PARAM_PITCH, self._pitch)
 
 	@property
 	def volume(self):
 		self._volume = _vocalizer.getParameter(self.tts, _vocalizer.VE_PARAM_VOLUME, type_=int)
-		return self._volume
+		return paramToPercent(self._volume, _vocalizer.VOLUME_MIN, _vocalizer.VOLUME_MAX)
 
 	@volume.setter
 	def volume(self, percent):
-		self._volume = percent
-		_vocalizer.setParameter(self.tts, _vocalizer.VE_PARAM_VOLUME, int(self._volume))
+		self._volume = percentToParam(percent, _vocalizer.VOLUME_MIN, _vocalizer.VOLUME_MAX)
+		_vocalizer.setParameter(self.tts, _vocalizer.VE_PARAM_VOLUME, self._volume)
 
 	@property
 	def variants(self):
@@ -1,4 +1,5 @@
 from collections import OrderedDict, defaultdict
+from functools import lru_cache
 
 import threading
 
@@ -18,6 +19,12 @@ from .voice.EspeakVoice import EspeakVoice
 from .voice.IBMVoice import IBMVoice
 
 
+@lru_cache(maxsize=None)
+def _getLocaleReadableName(locale_):
+	description = languageHandler.getLanguageDescription(locale_)
+	return "%s - %s" % (description, locale_) if description else locale_
+
+
 def joinObjectArray(srcArr1, srcArr2, key):
 	mergeArr = []
 	for srcObj2 in srcArr2:
@@ -37,8 +44,7 @@ def groupByField(arrSrc, field, applyKey, applyValue):
 	temp = {}
 	for item in arrSrc:
 		key = applyKey(item[field])
-		temp[key] = temp[key] if key in temp else []
-		temp[key].append(applyValue(item))
+		temp.setdefault(key, []).append(applyValue(item))
 
 	return temp
 
@@ -64,6 +70,7 @@ class VoiceManager(object):
 
 	def __init__(self):
 		self.lock = threading.Lock()
+		self._allVoices = None
 
 		self.installEngine = []
 		for item in self.voice_class.values():
@@ -107,6 +114,7 @@ class VoiceManager(object):
 			item.engineOff()
 
 		self.taskManager = None
+		self._allVoices = None
 
 	@property
 	def defaultVoiceInstance(self):
@@ -230,7 +238,7 @@ class VoiceManager(object):
 		self._localesToVoices = {
 			**groupByField(self.table, 'locale', lambda i: i, lambda i: i['name']),
 			# For locales with no country (i.g. "en") use all voices from all sub-locales
-			**groupByField(self.table, 'locale', lambda i: i.split('_')[0], lambda i: i['name']),
+			**groupByField(self.table, 'locale', lambda i: i.partition('_')[0], lambda i: i['name']),
 		}
 
 		self._voicesToEngines = {}
@@ -244,17 +252,22 @@ class VoiceManager(object):
 		# Kepp a list with existing voices in VoiceInfo objects.
 		self._voiceInfos = OrderedDict([(v.id, v) for v in voiceInfos])
 
+	def _getAllVoices(self):
+		# Enumerating voices goes through every engine core, so do it once per session.
+		if self._allVoices is None:
+			allVoices = []
+			for item in self.voice_class.values():
+				allVoices.extend(item.voices())
+			self._allVoices = sorted(allVoices, key=lambda item: (item['engine'], item['language'], item['name']))
+		return self._allVoices
+
 	def _setVoiceDatasEngineFilter(self):
-		self.tableEngineFilter = []
-		for item in self.voice_class.values():
-			self.tableEngineFilter.extend(item.voices())
-		self.tableEngineFilter = sorted(self.tableEngineFilter, key=lambda item: (item['engine'], item['language'], item['name']))
-		self.tableEngineFilter = list(filter(lambda item: item['engine'] in self.engines, self.tableEngineFilter))
+		self.tableEngineFilter = list(filter(lambda item: item['engine'] in self.engines, self._getAllVoices()))
 
 		self._localesToVoicesEngineFilter = {
 			**groupByField(self.tableEngineFilter, 'locale', lambda i: i, lambda i: i['name']),
 			# For locales with no country (i.g. "en") use all voices from all sub-locales
-			**groupByField(self.tableEngineFilter, 'locale', lambda i: i.split('_')[0], lambda i: i['name']),
+			**groupByField(self.tableEngineFilter, 'locale', lambda i: i.partition('_')[0], lambda i: i['name']),
 		}
 
 		self._voicesToEnginesEngineFilter = {}
@@ -352,5 +365,4 @@ class VoiceManager(object):
 		return voice
 
 	def _getLocaleReadableName(self, locale_):
-		description = languageHandler.getLanguageDescription(locale_)
-		return "%s - %s" % (description, locale_) if description else locale_
+		return _getLocaleReadableName(locale_)